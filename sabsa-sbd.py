@@ -4,11 +4,25 @@ import plotly.graph_objects as go
 import networkx as nx
 import numpy as np
 import json
-import uuid
+import pathlib
+import pickle
+import secrets
+import zstandard
+from collections import Counter
 from datetime import datetime
 import logging
-import xml.etree.ElementTree as ET
-from io import StringIO
+from lxml import etree
+from io import BytesIO, StringIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Configure logging for audit trail
 logging.basicConfig(filename='sabsa_audit.log', level=logging.INFO, 
@@ -22,8 +36,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enterprise-grade CSS with professional styling
-st.markdown("""
+# Enterprise-grade CSS with professional styling; module-level constant so
+# the blob is built once at import rather than per rerun
+PAGE_CSS = """
 <style>
     :root {
         --primary-color: #1e3a8a;
@@ -143,8 +158,41 @@ st.markdown("""
         border: 1px solid var(--border-color);
         text-align: center;
     }
+    .metric-card .metric-label {
+        font-size: 14px;
+        color: #6b7280;
+    }
+    .metric-card .metric-value {
+        font-size: 1.75rem;
+        font-weight: 700;
+        color: var(--primary-color);
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Re-emitted every run on purpose: Streamlit removes elements that are not
+# rendered on a rerun, so a session_state guard here would strip the styling
+# on the first interaction. The forward-message cache dedupes the payload.
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+# Alert templates, rendered through a single st.markdown call per handler
+ALERT_ERROR = '<div class="alert-error">{}</div>'
+ALERT_SUCCESS = '<div class="alert-success">{}</div>'
+
+# Metric card rendered as one HTML block (one element delta) per column
+METRIC_CARD = ('<div class="metric-card"><div class="metric-label">{}</div>'
+               '<div class="metric-value">{}</div></div>')
+
+# Above this many rendered elements, switch from SVG to WebGL scatter traces;
+# SVG keeps better hover/label fidelity for small frameworks
+WEBGL_THRESHOLD = 500
+
+# Above this many nodes, hover cards shrink to the node name only — closest-point
+# hover is O(N) per mousemove and full customdata makes every move expensive
+HOVER_THRESHOLD = 2000
+
+# On-disk store for version snapshots; session state keeps only their metadata
+VERSIONS_DIR = pathlib.Path(".sabsa_versions")
 
 # Simulated user authentication and RBAC
 if 'user' not in st.session_state:
@@ -255,8 +303,18 @@ if 'framework_data' not in st.session_state:
     }
 
 @st.cache_data
-def get_framework_data():
-    return st.session_state.framework_data
+def get_framework_snapshot(data_hash):
+    """Cached view of the framework node groups and connections.
+
+    data_hash (see framework_hash) keys the cache so the snapshot refreshes
+    whenever the framework data changes. Lets the analysis tabs read node
+    data without paying for a figure rebuild.
+    """
+    data = st.session_state.framework_data
+    # Connections are frozen to a tuple-of-tuples: cheap for st.cache_data to
+    # hash downstream and safe against accidental mutation of the cached view
+    return (data["main_domains"], data["secondary_nodes"],
+            data["process_nodes"], tuple(map(tuple, data["connections"])))
 
 def log_action(action, message):
     """Log user actions for audit trail."""
@@ -278,19 +336,66 @@ def validate_node_input(node_name, node_x, node_y, parent_node, node_type, exist
         errors.append("Secondary nodes must have a parent domain.")
     return errors
 
+# Hash-consing table for node records: structurally equal nodes across
+# version snapshots share one dict instead of each snapshot holding a copy
+_node_table = {}
+
+def _intern_node(node):
+    key = tuple(sorted(node.items()))
+    return _node_table.setdefault(key, dict(node))
+
+def _snapshot_framework(data):
+    """Deep snapshot of framework data with hash-consed node records."""
+    return {
+        "main_domains": {k: _intern_node(v) for k, v in data["main_domains"].items()},
+        "secondary_nodes": {k: _intern_node(v) for k, v in data["secondary_nodes"].items()},
+        "process_nodes": {k: _intern_node(v) for k, v in data["process_nodes"].items()},
+        "connections": list(data["connections"])
+    }
+
+def _thaw_framework(snapshot):
+    """Rebuild a mutable copy of a snapshot, leaving interned nodes untouched."""
+    return {
+        "main_domains": {k: dict(v) for k, v in snapshot["main_domains"].items()},
+        "secondary_nodes": {k: dict(v) for k, v in snapshot["secondary_nodes"].items()},
+        "process_nodes": {k: dict(v) for k, v in snapshot["process_nodes"].items()},
+        "connections": list(snapshot["connections"])
+    }
+
 def save_version():
-    """Save current framework state to version history."""
-    version_id = str(uuid.uuid4())[:8]
-    version_data = {
+    """Persist the current framework state to the on-disk version store.
+
+    Only lightweight metadata stays in session state; the snapshot itself is
+    pickled, zstd-compressed and written under VERSIONS_DIR, then loaded
+    lazily on restore.
+    """
+    version_id = secrets.token_hex(4)
+    data = st.session_state.framework_data
+    VERSIONS_DIR.mkdir(exist_ok=True)
+    payload = zstandard.ZstdCompressor().compress(pickle.dumps(_snapshot_framework(data)))
+    (VERSIONS_DIR / f"{version_id}.pkl.zst").write_bytes(payload)
+    st.session_state.version_history.append({
         "version_id": version_id,
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "data": st.session_state.framework_data.copy(),
-        "user": st.session_state.user["username"]
-    }
-    st.session_state.version_history.append(version_data)
+        "user": st.session_state.user["username"],
+        "nodes": len(data["main_domains"]) + len(data["secondary_nodes"]) + len(data["process_nodes"]),
+        "connections": len(data["connections"])
+    })
     log_action("save_version", f"Saved version {version_id}")
 
+def load_version(version_id):
+    """Read one snapshot back from the on-disk version store."""
+    payload = (VERSIONS_DIR / f"{version_id}.pkl.zst").read_bytes()
+    return pickle.loads(zstandard.ZstdDecompressor().decompress(payload))
+
+def framework_hash():
+    """Stable fingerprint of the framework data, used as a cache key."""
+    return json.dumps(st.session_state.framework_data, sort_keys=True, default=str)
+
+@st.fragment
 def create_interactive_framework():
+    # Runs as a fragment: the sidebar controls and management widgets below
+    # live inside it, so toggling them reruns only this view, not main()
     st.markdown('<h1 class="main-header">🔒 Enterprise SABSA Security Architecture Framework</h1>', unsafe_allow_html=True)
     
     # Simulated RBAC check
@@ -298,23 +403,30 @@ def create_interactive_framework():
     is_admin = user_role in ["admin", "architect"]
     
     # Load data
-    data = get_framework_data()
-    main_domains = data["main_domains"]
-    secondary_nodes = data["secondary_nodes"]
-    process_nodes = data["process_nodes"]
-    connections = data["connections"]
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(framework_hash())
     
     # Professional control panel
     st.sidebar.title("Framework Controls")
     view_mode = st.sidebar.radio("Mode", ["View", "Management"] if is_admin else ["View"], key="view_mode")
-    show_connections = st.sidebar.checkbox("Show Connections", value=True)
-    show_labels = st.sidebar.checkbox("Show Labels", value=True)
-    highlight_domain = st.sidebar.selectbox("Highlight Domain", ["None"] + list(main_domains.keys()))
-    node_opacity = st.sidebar.slider("Node Opacity", 0.5, 1.0, 0.8, 0.05)
-    show_risk_scores = st.sidebar.checkbox("Show Risk Scores", value=False)
+    # Form batches the view toggles into one rerun on Apply instead of a
+    # figure rebuild per widget change while the user configures the view
+    with st.sidebar.form("view_controls", border=False):
+        show_connections = st.checkbox("Show Connections", value=True)
+        show_labels = st.checkbox("Show Labels", value=True)
+        highlight_domain = st.selectbox("Highlight Domain", ["None"] + list(main_domains.keys()))
+        node_opacity = st.slider("Node Opacity", 0.5, 1.0, 0.8, 0.05)
+        show_risk_scores = st.checkbox("Show Risk Scores", value=False)
+        st.form_submit_button("Apply")
     
     # Management mode (admin/architect only)
     if view_mode == "Management" and is_admin:
+        # The snapshot above is a cached copy; edits mutate the live
+        # session-state dicts directly, so no write-back is needed — the
+        # content hash changing is what refreshes the cached views
+        data = st.session_state.framework_data
+        main_domains, secondary_nodes, process_nodes = (
+            data["main_domains"], data["secondary_nodes"], data["process_nodes"])
+        conn_list = data["connections"]
         with st.sidebar.expander("Add New Node", expanded=False):
             st.subheader("Create Node")
             node_type = st.selectbox("Node Type", ["Main Domain", "Secondary Node", "Process Node"], key="node_type")
@@ -331,11 +443,10 @@ def create_interactive_framework():
             if st.button("Add Node", key="add_node"):
                 errors = validate_node_input(node_name, node_x, node_y, parent_node, node_type)
                 if errors:
-                    for error in errors:
-                        st.markdown(f'<div class="alert-error">{error}</div>', unsafe_allow_html=True)
+                    st.markdown("".join(ALERT_ERROR.format(error) for error in errors), unsafe_allow_html=True)
                 else:
                     save_version()
-                    node_id = str(uuid.uuid4())[:8]
+                    node_id = secrets.token_hex(4)
                     color = "#1e3a8a" if node_type == "Main Domain" else "#3b82f6" if node_type == "Secondary Node" else "#60a5fa"
                     
                     if node_type == "Main Domain":
@@ -353,15 +464,9 @@ def create_interactive_framework():
                         }
                     
                     for target in connect_to:
-                        connections.append((node_name, target))
-                    
-                    st.session_state.framework_data = {
-                        "main_domains": main_domains,
-                        "secondary_nodes": secondary_nodes,
-                        "process_nodes": process_nodes,
-                        "connections": connections
-                    }
-                    st.markdown(f'<div class="alert-success">Node "{node_name}" added successfully</div>', unsafe_allow_html=True)
+                        conn_list.append((node_name, target))
+
+                    st.markdown(ALERT_SUCCESS.format(f'Node "{node_name}" added successfully'), unsafe_allow_html=True)
                     log_action("add_node", f"Added node: {node_name}")
         
         with st.sidebar.expander("Move Node", expanded=False):
@@ -373,7 +478,7 @@ def create_interactive_framework():
             
             if st.button("Move Node", key="move_node_btn"):
                 if new_x < 0 or new_x > 10 or new_y < 0 or new_y > 5:
-                    st.markdown(f'<div class="alert-error">Position coordinates must be within bounds (X: 0-10, Y: 0-5).</div>', unsafe_allow_html=True)
+                    st.markdown(ALERT_ERROR.format('Position coordinates must be within bounds (X: 0-10, Y: 0-5).'), unsafe_allow_html=True)
                 else:
                     save_version()
                     if node_to_move in main_domains:
@@ -386,13 +491,7 @@ def create_interactive_framework():
                         process_nodes[node_to_move]["x"] = new_x
                         process_nodes[node_to_move]["y"] = new_y
                     
-                    st.session_state.framework_data = {
-                        "main_domains": main_domains,
-                        "secondary_nodes": secondary_nodes,
-                        "process_nodes": process_nodes,
-                        "connections": connections
-                    }
-                    st.markdown(f'<div class="alert-success">Node "{node_to_move}" moved to ({new_x}, {new_y})</div>', unsafe_allow_html=True)
+                    st.markdown(ALERT_SUCCESS.format(f'Node "{node_to_move}" moved to ({new_x}, {new_y})'), unsafe_allow_html=True)
                     log_action("move_node", f"Moved node {node_to_move} to ({new_x}, {new_y})")
         
         with st.sidebar.expander("Manage Connections", expanded=False):
@@ -403,15 +502,19 @@ def create_interactive_framework():
                                      list(main_domains.keys()) + list(secondary_nodes.keys()) + list(process_nodes.keys()), key="target_node")
             
             if st.button("Add Connection", key="add_connection"):
+                # Direction-insensitive O(1) duplicate check instead of two list scans
+                conn_set = set()
+                for a, b in connections:
+                    conn_set.add((a, b))
+                    conn_set.add((b, a))
                 if source_node == target_node:
-                    st.markdown(f'<div class="alert-error">Source and target nodes cannot be the same.</div>', unsafe_allow_html=True)
-                elif (source_node, target_node) in connections or (target_node, source_node) in connections:
-                    st.markdown(f'<div class="alert-error">Connection already exists.</div>', unsafe_allow_html=True)
+                    st.markdown(ALERT_ERROR.format('Source and target nodes cannot be the same.'), unsafe_allow_html=True)
+                elif (source_node, target_node) in conn_set:
+                    st.markdown(ALERT_ERROR.format('Connection already exists.'), unsafe_allow_html=True)
                 else:
                     save_version()
-                    connections.append((source_node, target_node))
-                    st.session_state.framework_data["connections"] = connections
-                    st.markdown(f'<div class="alert-success">Connection added: {source_node} → {target_node}</div>', unsafe_allow_html=True)
+                    conn_list.append((source_node, target_node))
+                    st.markdown(ALERT_SUCCESS.format(f'Connection added: {source_node} → {target_node}'), unsafe_allow_html=True)
                     log_action("add_connection", f"Added connection: {source_node} → {target_node}")
             
             connection_to_remove = st.selectbox("Select Connection to Remove", 
@@ -420,9 +523,8 @@ def create_interactive_framework():
                 if connection_to_remove:
                     save_version()
                     s, t = connection_to_remove.split(" → ")
-                    connections.remove((s, t))
-                    st.session_state.framework_data["connections"] = connections
-                    st.markdown(f'<div class="alert-success">Connection removed: {s} → {t}</div>', unsafe_allow_html=True)
+                    conn_list.remove((s, t))
+                    st.markdown(ALERT_SUCCESS.format(f'Connection removed: {s} → {t}'), unsafe_allow_html=True)
                     log_action("remove_connection", f"Removed connection: {s} → {t}")
         
         with st.sidebar.expander("Delete Node", expanded=False):
@@ -441,58 +543,209 @@ def create_interactive_framework():
                 elif node_to_delete in process_nodes:
                     del process_nodes[node_to_delete]
                 
-                connections[:] = [c for c in connections if node_to_delete not in c]
-                
-                st.session_state.framework_data = {
-                    "main_domains": main_domains,
-                    "secondary_nodes": secondary_nodes,
-                    "process_nodes": process_nodes,
-                    "connections": connections
-                }
-                st.markdown(f'<div class="alert-success">Node "{node_to_delete}" deleted successfully</div>', unsafe_allow_html=True)
+                conn_list[:] = [c for c in conn_list if node_to_delete not in c]
+
+                st.markdown(ALERT_SUCCESS.format(f'Node "{node_to_delete}" deleted successfully'), unsafe_allow_html=True)
                 log_action("delete_node", f"Deleted node: {node_to_delete}")
     
+    # Render the (cached) visualization
+    fig = build_figure(node_opacity, show_connections, show_labels,
+                       highlight_domain, show_risk_scores,
+                       framework_hash())
+    st.plotly_chart(fig, use_container_width=True, key="sabsa_framework_chart", config={
+        'displayModeBar': True,
+        'modeBarButtonsToAdd': ['pan2d', 'zoomIn2d', 'zoomOut2d', 'resetScale2d', 'hoverClosest'],
+        'scrollZoom': True,
+        'displaylogo': False
+    })
+
+def _edge_arrays(pairs):
+    """Strided NaN-separated polyline arrays: starts at 0::3, ends at 1::3, gap at 2::3."""
+    edge_x = np.empty(3 * len(pairs), dtype=np.float32)
+    edge_y = np.empty(3 * len(pairs), dtype=np.float32)
+    if pairs:
+        starts = np.asarray([p[0] for p in pairs], dtype=np.float32)
+        ends = np.asarray([p[1] for p in pairs], dtype=np.float32)
+        edge_x[0::3] = starts[:, 0]
+        edge_x[1::3] = ends[:, 0]
+        edge_x[2::3] = np.nan
+        edge_y[0::3] = starts[:, 1]
+        edge_y[1::3] = ends[:, 1]
+        edge_y[2::3] = np.nan
+    return edge_x, edge_y
+
+@st.cache_data(show_spinner=False)
+def get_render_arrays(data_hash):
+    """Per-trace render inputs, precomputed once per framework change.
+
+    Everything the figure builder needs that depends only on the data —
+    float32 coordinate arrays, names, base colors, hover fields and the
+    truncated process labels — is extracted here so rebuilding the figure
+    for a view-flag change no longer iterates the node dicts at all.
+    """
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(data_hash)
+
+    def unpack(group):
+        """One fused pass over group.values() instead of one scan per field."""
+        rows = [(data["x"], data["y"], data["color"], data.get("parent", ""),
+                 data.get("description", ""), data.get("risk_score", 0),
+                 data.get("compliance", ""))
+                for data in group.values()]
+        xs, ys, colors, parents, descriptions, risk_scores, compliance = \
+            zip(*rows) if rows else ((),) * 7
+        return (np.asarray((xs, ys), dtype=np.float32).T, np.asarray(colors),
+                np.asarray(parents), list(descriptions), list(risk_scores),
+                list(compliance))
+
+    coords = {}
+    for node_set in (main_domains, secondary_nodes, process_nodes):
+        coords.update((name, (data["x"], data["y"])) for name, data in node_set.items())
+
+    # Edge polyline arrays precomputed so the figure builder passes them straight in
+    pairs = [(coords[a], coords[b]) for a, b in connections if a in coords and b in coords]
+    edge_x, edge_y = _edge_arrays(pairs)
+
+    main_xy, main_colors, _, main_descriptions, main_risk_scores, main_compliance = unpack(main_domains)
+    sec_xy, sec_colors, sec_parents, sec_descriptions, sec_risk_scores, sec_compliance = unpack(secondary_nodes)
+    proc_xy, proc_colors, _, proc_descriptions, proc_risk_scores, proc_compliance = unpack(process_nodes)
+
+    proc_names = pd.Series(list(process_nodes.keys()))
+    # Struct-of-arrays: names, parents and colors land in ndarrays so the
+    # figure builder can recolor highlights with np.where masks instead of
+    # per-item Python comparisons
+    return {
+        "coords": coords,
+        "edge_x": edge_x,
+        "edge_y": edge_y,
+        "main_xy": main_xy,
+        "main_names": np.asarray(list(main_domains.keys())),
+        "main_colors": main_colors,
+        "main_descriptions": main_descriptions,
+        "main_risk_scores": main_risk_scores,
+        "main_compliance": main_compliance,
+        "sec_xy": sec_xy,
+        "sec_names": np.asarray(list(secondary_nodes.keys())),
+        "sec_colors": sec_colors,
+        "sec_parents": sec_parents,
+        "sec_descriptions": sec_descriptions,
+        "sec_risk_scores": sec_risk_scores,
+        "sec_compliance": sec_compliance,
+        "proc_xy": proc_xy,
+        "proc_names": proc_names.to_numpy(),
+        "proc_labels": proc_names.where(proc_names.str.len() <= 10, proc_names.str.slice(0, 10) + '...').to_numpy(),
+        "proc_colors": proc_colors,
+        "proc_descriptions": proc_descriptions,
+        "proc_risk_scores": proc_risk_scores,
+        "proc_compliance": proc_compliance
+    }
+
+# Below this many nodes the plain NumPy scatter wins; the JIT kernel only
+# pays for its dispatch (and first-call compile) on large frameworks
+NUMBA_MATRIX_THRESHOLD = 1000
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _scatter_matrix(src, dst, n):
+        matrix = np.zeros((n, n), dtype=np.int8)
+        for k in prange(src.size):
+            matrix[src[k], dst[k]] = 1
+            matrix[dst[k], src[k]] = 1
+        return matrix
+
+@st.cache_data(show_spinner=False)
+def get_connection_matrix(data_hash):
+    """Node ordering and symmetric adjacency matrix, cached per framework change."""
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(data_hash)
+    all_nodes = list(main_domains) + list(secondary_nodes) + list(process_nodes)
+    n = len(all_nodes)
+
+    # Symmetric scatter via integer indices instead of an O(N²·E) scan
+    idx = {name: i for i, name in enumerate(all_nodes)}
+    valid = [(a, b) for a, b in connections if a in idx and b in idx]
+    if not valid:
+        return all_nodes, np.zeros((n, n), dtype=np.int8)
+    src = np.fromiter((idx[a] for a, b in valid), dtype=np.int32, count=len(valid))
+    dst = np.fromiter((idx[b] for a, b in valid), dtype=np.int32, count=len(valid))
+
+    if njit is not None and n >= NUMBA_MATRIX_THRESHOLD:
+        return all_nodes, _scatter_matrix(src, dst, n)
+    matrix = np.zeros((n, n), dtype=np.int8)
+    matrix[src, dst] = 1
+    matrix |= matrix.T
+    return all_nodes, matrix
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_figure(node_opacity, show_connections, show_labels, highlight_domain, show_risk_scores, data_hash):
+    """Build the framework visualization Figure, cached across reruns.
+
+    data_hash fingerprints the framework data (see framework_hash), so any
+    mutation invalidates the cache while reruns triggered by unrelated
+    widgets reuse the stored figure. cache_resource hands back the Figure
+    itself with no pickle round trip; nothing mutates it after it is built,
+    so sharing the instance across reruns is safe.
+    """
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(data_hash)
+    arrays = get_render_arrays(data_hash)
+
     # Create professional-grade visualization
     fig = go.Figure()
-    
-    # Add connections with smooth styling
+
+    # Past the threshold, GPU-backed Scattergl keeps pan/zoom responsive
+    total_nodes = len(main_domains) + len(secondary_nodes) + len(process_nodes)
+    total_elements = total_nodes + len(connections)
+    scatter_cls = go.Scattergl if total_elements > WEBGL_THRESHOLD else go.Scatter
+    rich_hover = total_nodes <= HOVER_THRESHOLD
+    name_only_hover = '<b>%{text}</b><extra></extra>'
+    # Linear segments only: SVG splines cost a per-segment Bezier fit and
+    # scattergl would silently fall back to linear anyway
+    edge_line = dict(color='rgba(75,85,99,0.3)', width=2)
+
+    # Add all connections as a single trace, separated by None breaks —
+    # Plotly treats one trace with gaps far more cheaply than one trace per edge
     if show_connections:
-        for connection in connections:
-            start_node, end_node = connection
-            start_coords = end_coords = None
-            
-            for node_set in [main_domains, secondary_nodes, process_nodes]:
-                if start_node in node_set:
-                    start_coords = (node_set[start_node]["x"], node_set[start_node]["y"])
-                if end_node in node_set:
-                    end_coords = (node_set[end_node]["x"], node_set[end_node]["y"])
-            
-            if start_coords and end_coords:
-                fig.add_trace(go.Scatter(
-                    x=[start_coords[0], end_coords[0]], 
-                    y=[start_coords[1], end_coords[1]],
-                    mode='lines',
-                    line=dict(color='rgba(75,85,99,0.3)', width=2, shape='spline'),
-                    showlegend=False,
-                    hoverinfo='none'
-                ))
+        # Endpoint arrays are precomputed in the cached arrays layer. With a
+        # highlight active, cull to edges inside the highlighted domain's
+        # neighbourhood — its direct connections plus its secondary nodes
+        edge_x, edge_y = arrays["edge_x"], arrays["edge_y"]
+        if highlight_domain != "None":
+            visible = {highlight_domain}
+            for a, b in connections:
+                if a == highlight_domain:
+                    visible.add(b)
+                elif b == highlight_domain:
+                    visible.add(a)
+            visible.update(name for name, data in secondary_nodes.items()
+                           if data["parent"] == highlight_domain)
+            coords = arrays["coords"]
+            edge_x, edge_y = _edge_arrays(
+                [(coords[a], coords[b]) for a, b in connections
+                 if a in visible and b in visible and a in coords and b in coords])
+        if edge_x.size:
+            fig.add_trace(scatter_cls(
+                x=edge_x,
+                y=edge_y,
+                mode='lines',
+                line=edge_line,
+                showlegend=False,
+                hoverinfo='none'
+            ))
     
     # Add main domain nodes
-    main_x = [data["x"] for data in main_domains.values()]
-    main_y = [data["y"] for data in main_domains.values()]
-    main_names = list(main_domains.keys())
-    main_colors = ['#dc2626' if name == highlight_domain else data["color"] for name, data in main_domains.items()]
-    main_descriptions = [data.get("description", "") for data in main_domains.values()]
-    main_risk_scores = [data.get("risk_score", 0) for data in main_domains.values()]
-    main_compliance = [data.get("compliance", "") for data in main_domains.values()]
+    main_xy = arrays["main_xy"]
+    main_names = arrays["main_names"]
+    main_colors = (np.where(main_names == highlight_domain, '#dc2626', arrays["main_colors"])
+                   if highlight_domain != "None" else arrays["main_colors"])
+    main_descriptions = arrays["main_descriptions"]
+    main_risk_scores = arrays["main_risk_scores"]
+    main_compliance = arrays["main_compliance"]
     
     # Determine marker color based on show_risk_scores
     main_marker_color = main_risk_scores if show_risk_scores else main_colors
     main_colorscale = 'Reds' if show_risk_scores else None
     main_showscale = show_risk_scores
     
-    fig.add_trace(go.Scatter(
-        x=main_x, y=main_y,
+    fig.add_trace(scatter_cls(
+        x=main_xy[:, 0], y=main_xy[:, 1],
         mode='markers+text' if show_labels else 'markers',
         marker=dict(
             size=80,
@@ -509,27 +762,26 @@ def create_interactive_framework():
         textposition="middle center",
         textfont=dict(size=12, color='#ffffff', family="Inter"),
         name="Main Domains",
-        hovertemplate='<b>%{text}</b><br>Type: Main Domain<br>Description: %{customdata[0]}<br>Risk Score: %{customdata[1]:.2f}<br>Compliance: %{customdata[2]}<extra></extra>',
-        customdata=list(zip(main_descriptions, main_risk_scores, main_compliance))
+        hovertemplate='<b>%{text}</b><br>Type: Main Domain<br>Description: %{customdata[0]}<br>Risk Score: %{customdata[1]:.2f}<br>Compliance: %{customdata[2]}<extra></extra>' if rich_hover else name_only_hover,
+        customdata=np.array(list(zip(main_descriptions, main_risk_scores, main_compliance)), dtype=object) if rich_hover else None
     ))
     
     # Add secondary nodes
-    sec_x = [data["x"] for data in secondary_nodes.values()]
-    sec_y = [data["y"] for data in secondary_nodes.values()]
-    sec_names = list(secondary_nodes.keys())
-    sec_colors = ['#f87171' if highlight_domain != "None" and secondary_nodes[name]["parent"] == highlight_domain 
-                 else data["color"] for name, data in secondary_nodes.items()]
-    sec_parents = [data["parent"] for data in secondary_nodes.values()]
-    sec_descriptions = [data.get("description", "") for data in secondary_nodes.values()]
-    sec_risk_scores = [data.get("risk_score", 0) for data in secondary_nodes.values()]
-    sec_compliance = [data.get("compliance", "") for data in secondary_nodes.values()]
+    sec_xy = arrays["sec_xy"]
+    sec_names = arrays["sec_names"]
+    sec_parents = arrays["sec_parents"]
+    sec_colors = (np.where(sec_parents == highlight_domain, '#f87171', arrays["sec_colors"])
+                  if highlight_domain != "None" else arrays["sec_colors"])
+    sec_descriptions = arrays["sec_descriptions"]
+    sec_risk_scores = arrays["sec_risk_scores"]
+    sec_compliance = arrays["sec_compliance"]
     
     # Determine marker color for secondary nodes
     sec_marker_color = sec_risk_scores if show_risk_scores else sec_colors
     sec_colorscale = 'Reds' if show_risk_scores else None
     
-    fig.add_trace(go.Scatter(
-        x=sec_x, y=sec_y,
+    fig.add_trace(scatter_cls(
+        x=sec_xy[:, 0], y=sec_xy[:, 1],
         mode='markers+text' if show_labels else 'markers',
         marker=dict(
             size=60,
@@ -546,25 +798,24 @@ def create_interactive_framework():
         textposition="middle center",
         textfont=dict(size=10, family="Inter"),
         name="Secondary Nodes",
-        hovertemplate='<b>%{text}</b><br>Type: Secondary<br>Parent: %{customdata[0]}<br>Description: %{customdata[1]}<br>Risk Score: %{customdata[2]:.2f}<br>Compliance: %{customdata[3]}<extra></extra>',
-        customdata=list(zip(sec_parents, sec_descriptions, sec_risk_scores, sec_compliance))
+        hovertemplate='<b>%{text}</b><br>Type: Secondary<br>Parent: %{customdata[0]}<br>Description: %{customdata[1]}<br>Risk Score: %{customdata[2]:.2f}<br>Compliance: %{customdata[3]}<extra></extra>' if rich_hover else name_only_hover,
+        customdata=np.array(list(zip(sec_parents, sec_descriptions, sec_risk_scores, sec_compliance)), dtype=object) if rich_hover else None
     ))
     
     # Add process nodes
-    proc_x = [data["x"] for data in process_nodes.values()]
-    proc_y = [data["y"] for data in process_nodes.values()]
-    proc_names = list(process_nodes.keys())
-    proc_colors = [data["color"] for data in process_nodes.values()]
-    proc_descriptions = [data.get("description", "") for data in process_nodes.values()]
-    proc_risk_scores = [data.get("risk_score", 0) for data in process_nodes.values()]
-    proc_compliance = [data.get("compliance", "") for data in process_nodes.values()]
+    proc_xy = arrays["proc_xy"]
+    proc_labels = arrays["proc_labels"] if show_labels else None
+    proc_colors = arrays["proc_colors"]
+    proc_descriptions = arrays["proc_descriptions"]
+    proc_risk_scores = arrays["proc_risk_scores"]
+    proc_compliance = arrays["proc_compliance"]
     
     # Determine marker color for process nodes
     proc_marker_color = proc_risk_scores if show_risk_scores else proc_colors
     proc_colorscale = 'Reds' if show_risk_scores else None
     
-    fig.add_trace(go.Scatter(
-        x=proc_x, y=proc_y,
+    fig.add_trace(scatter_cls(
+        x=proc_xy[:, 0], y=proc_xy[:, 1],
         mode='markers+text' if show_labels else 'markers',
         marker=dict(
             size=40,
@@ -577,12 +828,12 @@ def create_interactive_framework():
             symbol='circle',
             opacity=node_opacity
         ),
-        text=[name[:10] + '...' if len(name) > 10 else name for name in proc_names] if show_labels else None,
+        text=proc_labels,
         textposition="middle center",
         textfont=dict(size=8, family="Inter"),
         name="Process Nodes",
-        hovertemplate='<b>%{text}</b><br>Type: Process<br>Description: %{customdata[0]}<br>Risk Score: %{customdata[1]:.2f}<br>Compliance: %{customdata[2]}<extra></extra>',
-        customdata=list(zip(proc_descriptions, proc_risk_scores, proc_compliance))
+        hovertemplate='<b>%{text}</b><br>Type: Process<br>Description: %{customdata[0]}<br>Risk Score: %{customdata[1]:.2f}<br>Compliance: %{customdata[2]}<extra></extra>' if rich_hover else name_only_hover,
+        customdata=np.array(list(zip(proc_descriptions, proc_risk_scores, proc_compliance)), dtype=object) if rich_hover else None
     ))
     
     # Professional layout
@@ -624,22 +875,112 @@ def create_interactive_framework():
         margin=dict(l=30, r=30, t=80, b=30),
         font=dict(family="Inter")
     )
-    
-    # Display chart with advanced interactivity
-    st.plotly_chart(fig, use_container_width=True, config={
-        'displayModeBar': True,
-        'modeBarButtonsToAdd': ['pan2d', 'zoomIn2d', 'zoomOut2d', 'resetScale2d', 'hoverClosest'],
-        'scrollZoom': True,
-        'displaylogo': False
+
+    return fig
+
+@st.cache_data(show_spinner=False)
+def get_node_counts(data_hash):
+    """Single-pass connection and parent counters, shared by table and export builds."""
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(data_hash)
+    conn_count = Counter()
+    for a, b in connections:
+        conn_count[a] += 1
+        conn_count[b] += 1
+    sec_per_parent = Counter(node["parent"] for node in secondary_nodes.values())
+    return conn_count, sec_per_parent
+
+@st.cache_data
+def build_export_rows(data_hash):
+    """One row per node carrying every column the CSV/JSON/XML exports need."""
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(data_hash)
+    conn_count, _ = get_node_counts(data_hash)
+
+    # Frames straight from the dict-of-dicts, concatenated once, instead of
+    # boxing every node into a row dict in Python
+    frames = [
+        pd.DataFrame.from_dict(group, orient="index")
+          .rename_axis("Node").reset_index()
+          .assign(Type=type_name)
+        for group, type_name in ((main_domains, "Main Domain"),
+                                 (secondary_nodes, "Secondary"),
+                                 (process_nodes, "Process"))
+        if group
+    ]
+    export_df = pd.concat(frames, ignore_index=True)
+    if "parent" not in export_df.columns:
+        export_df["parent"] = ""
+    export_df = export_df.rename(columns={
+        "x": "X", "y": "Y", "color": "Color", "parent": "Parent",
+        "description": "Description", "risk_score": "Risk Score",
+        "compliance": "Compliance"
     })
-    
-    return main_domains, secondary_nodes, process_nodes, connections
+    export_df["Connections"] = export_df["Node"].map(conn_count).fillna(0).astype("int32")
+    for column, default in (("Parent", ""), ("Description", ""),
+                            ("Risk Score", 0), ("Compliance", "")):
+        if column not in export_df.columns:
+            export_df[column] = default
+        else:
+            export_df[column] = export_df[column].fillna(default)
+    return export_df[["Node", "Type", "X", "Y", "Color", "Parent", "Connections",
+                      "Description", "Risk Score", "Compliance"]]
+
+@st.cache_data(show_spinner=False)
+def get_export_csv(data_hash):
+    """CSV export bytes, serialized once per framework change."""
+    return build_export_rows(data_hash).to_csv(index=False).encode()
+
+@st.cache_data(show_spinner=False)
+def get_export_json(data_hash, username):
+    """Indented JSON export bytes, serialized once per framework change.
+
+    Indented json.dumps is Python-loop-bound, so the encoded document is
+    cached; generated_date records when this framework state was first
+    serialized, which holds for every later download of the same state.
+    """
+    connections = get_framework_snapshot(data_hash)[3]
+    framework_export = {
+        "nodes": build_export_rows(data_hash).to_dict(orient="records"),
+        "connections": connections,
+        "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "version": "4.0",
+        "user": username
+    }
+    if orjson is not None:
+        return orjson.dumps(framework_export,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(framework_export, indent=2).encode()
+
+@st.cache_data(show_spinner=False)
+def get_domain_table(data_hash):
+    """Domain Analysis breakdown as a typed DataFrame, cached per framework change."""
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(data_hash)
+    conn_count, sec_per_parent = get_node_counts(data_hash)
+
+    # Columnar build: appending to per-column lists avoids boxing every
+    # row into a dict and the object-dtype frame pd.DataFrame infers from one
+    domain_cols = {"Domain": [], "Type": [], "Secondary Nodes": [], "Connections": [],
+                   "Description": [], "Risk Score": [], "Compliance": []}
+    for group, type_name in ((main_domains, "Main"),
+                             (secondary_nodes, "Secondary"),
+                             (process_nodes, "Process")):
+        for name, data in group.items():
+            domain_cols["Domain"].append(name)
+            domain_cols["Type"].append(type_name)
+            domain_cols["Secondary Nodes"].append(sec_per_parent.get(name, 0) if type_name == "Main" else 0)
+            domain_cols["Connections"].append(conn_count.get(name, 0))
+            domain_cols["Description"].append(data.get("description", ""))
+            domain_cols["Risk Score"].append(data.get("risk_score", 0))
+            domain_cols["Compliance"].append(data.get("compliance", ""))
+
+    return pd.DataFrame(domain_cols).astype({"Secondary Nodes": "int32",
+                                             "Connections": "int32",
+                                             "Risk Score": "float32"})
 
 def show_detailed_view():
     st.header("Detailed Framework Analysis")
-    
-    main_domains, secondary_nodes, process_nodes, connections = create_interactive_framework()
-    
+
+    main_domains, secondary_nodes, process_nodes, connections = get_framework_snapshot(framework_hash())
+
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📊 Domain Analysis",
         "🔗 Connection Matrix",
@@ -651,60 +992,14 @@ def show_detailed_view():
     with tab1:
         st.subheader("Domain Analysis")
         
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Main Domains", len(main_domains), delta_color="normal")
-            st.markdown('</div>', unsafe_allow_html=TrueAnche)
-        with col2:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Secondary Nodes", len(secondary_nodes), delta_color="normal")
-            st.markdown('</div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Process Nodes", len(process_nodes), delta_color="normal")
-            st.markdown('</div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Connections", len(connections), delta_color="normal")
-            st.markdown('</div>', unsafe_allow_html=True)
+        metrics = (("Main Domains", len(main_domains)),
+                   ("Secondary Nodes", len(secondary_nodes)),
+                   ("Process Nodes", len(process_nodes)),
+                   ("Connections", len(connections)))
+        for col, (label, value) in zip(st.columns(4), metrics):
+            col.markdown(METRIC_CARD.format(label, value), unsafe_allow_html=True)
         
-        domain_data = []
-        for domain, data in main_domains.items():
-            secondary_count = sum(1 for node in secondary_nodes.values() if node["parent"] == domain)
-            domain_data.append({
-                "Domain": domain,
-                "Type": "Main",
-                "Secondary Nodes": secondary_count,
-                "Connections": len([c for c in connections if domain in c]),
-                "Description": data.get("description", ""),
-                "Risk Score": data.get("risk_score", 0),
-                "Compliance": data.get("compliance", "")
-            })
-        
-        for node, data in secondary_nodes.items():
-            domain_data.append({
-                "Domain": node,
-                "Type": "Secondary",
-                "Secondary Nodes": 0,
-                "Connections": len([c for c in connections if node in c]),
-                "Description": data.get("description", ""),
-                "Risk Score": data.get("risk_score", 0),
-                "Compliance": data.get("compliance", "")
-            })
-        
-        for node, data in process_nodes.items():
-            domain_data.append({
-                "Domain": node,
-                "Type": "Process",
-                "Secondary Nodes": 0,
-                "Connections": len([c for c in connections if node in c]),
-                "Description": data.get("description", ""),
-                "Risk Score": data.get("risk_score", 0),
-                "Compliance": data.get("compliance", "")
-            })
-        
-        df = pd.DataFrame(domain_data)
+        df = get_domain_table(framework_hash())
         st.dataframe(
             df,
             use_container_width=True,
@@ -722,15 +1017,8 @@ def show_detailed_view():
     with tab2:
         st.subheader("Connection Matrix")
         
-        all_nodes = list(main_domains.keys()) + list(secondary_nodes.keys()) + list(process_nodes.keys())
-        matrix_size = len(all_nodes)
-        matrix = np.zeros((matrix_size, matrix_size))
-        
-        for i, node1 in enumerate(all_nodes):
-            for j, node2 in enumerate(all_nodes):
-                if (node1, node2) in connections or (node2, node1) in connections:
-                    matrix[i][j] = 1
-        
+        all_nodes, matrix = get_connection_matrix(framework_hash())
+
         fig_matrix = go.Figure(data=go.Heatmap(
             z=matrix,
             x=all_nodes,
@@ -794,141 +1082,78 @@ def show_detailed_view():
             "Monitoring and metrics established"
         ]
         
-        for item in checklist_items:
-            st.checkbox(item, key=f"check_{item}")
+        # One data_editor widget instead of ten checkboxes — a single state
+        # round-trip per rerun
+        st.data_editor(
+            pd.DataFrame({"Item": checklist_items, "Done": False}),
+            column_config={
+                "Item": st.column_config.TextColumn("Item", disabled=True),
+                "Done": st.column_config.CheckboxColumn("Done")
+            },
+            hide_index=True,
+            use_container_width=True,
+            key="implementation_checklist"
+        )
     
     with tab4:
         st.subheader("Export Options")
         
         if st.button("Export as JSON"):
-            framework_export = {
-                "main_domains": main_domains,
-                "secondary_nodes": secondary_nodes,
-                "process_nodes": process_nodes,
-                "connections": connections,
-                "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "version": "4.0",
-                "user": st.session_state.user["username"]
-            }
-            
-            st.json(framework_export)
-            
-            json_string = json.dumps(framework_export, indent=2)
+            json_bytes = get_export_json(framework_hash(), st.session_state.user["username"])
+
+            st.json(json_bytes.decode())
+
             st.download_button(
                 label="Download JSON",
-                data=json_string,
+                data=json_bytes,
                 file_name="sabsa_framework.json",
                 mime="application/json"
             )
             log_action("export_json", "Exported framework as JSON")
         
         if st.button("Export as CSV"):
-            export_data = []
-            
-            for domain, data in main_domains.items():
-                export_data.append({
-                    "Node": domain,
-                    "Type": "Main Domain",
-                    "X": data["x"],
-                    "Y": data["y"],
-                    "Color": data["color"],
-                    "Parent": "",
-                    "Connections": len([c for c in connections if domain in c]),
-                    "Description": data.get("description", ""),
-                    "Risk Score": data.get("risk_score", 0),
-                    "Compliance": data.get("compliance", "")
-                })
-            
-            for node, data in secondary_nodes.items():
-                export_data.append({
-                    "Node": node,
-                    "Type": "Secondary",
-                    "X": data["x"],
-                    "Y": data["y"],
-                    "Color": data["color"],
-                    "Parent": data["parent"],
-                    "Connections": len([c for c in connections if node in c]),
-                    "Description": data.get("description", ""),
-                    "Risk Score": data.get("risk_score", 0),
-                    "Compliance": data.get("compliance", "")
-                })
-            
-            for node, data in process_nodes.items():
-                export_data.append({
-                    "Node": node,
-                    "Type": "Process",
-                    "X": data["x"],
-                    "Y": data["y"],
-                    "Color": data["color"],
-                    "Parent": "",
-                    "Connections": len([c for c in connections if node in c]),
-                    "Description": data.get("description", ""),
-                    "Risk Score": data.get("risk_score", 0),
-                    "Compliance": data.get("compliance", "")
-                })
-            
-            export_df = pd.DataFrame(export_data)
-            csv = export_df.to_csv(index=False)
-            
             st.download_button(
                 label="Download CSV",
-                data=csv,
+                data=get_export_csv(framework_hash()),
                 file_name="sabsa_framework.csv",
                 mime="text/csv"
             )
             log_action("export_csv", "Exported framework as CSV")
         
         if st.button("Export as XML"):
-            root = ET.Element("SABSAFramework")
-            root.set("version", "4.0")
-            root.set("generated_date", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            root.set("user", st.session_state.user["username"])
-            
-            main_domains_elem = ET.SubElement(root, "MainDomains")
-            for domain, data in main_domains.items():
-                node = ET.SubElement(main_domains_elem, "Node")
-                node.set("name", domain)
-                node.set("x", str(data["x"]))
-                node.set("y", str(data["y"]))
-                node.set("color", data["color"])
-                node.set("description", data.get("description", ""))
-                node.set("risk_score", str(data.get("risk_score", 0)))
-                node.set("compliance", data.get("compliance", ""))
-            
-            secondary_nodes_elem = ET.SubElement(root, "SecondaryNodes")
-            for node, data in secondary_nodes.items():
-                node_elem = ET.SubElement(secondary_nodes_elem, "Node")
-                node_elem.set("name", node)
-                node_elem.set("x", str(data["x"]))
-                node_elem.set("y", str(data["y"]))
-                node_elem.set("color", data["color"])
-                node_elem.set("parent", data["parent"])
-                node_elem.set("description", data.get("description", ""))
-                node_elem.set("risk_score", str(data.get("risk_score", 0)))
-                node_elem.set("compliance", data.get("compliance", ""))
-            
-            process_nodes_elem = ET.SubElement(root, "ProcessNodes")
-            for node, data in process_nodes.items():
-                node_elem = ET.SubElement(process_nodes_elem, "Node")
-                node_elem.set("name", node)
-                node_elem.set("x", str(data["x"]))
-                node_elem.set("y", str(data["y"]))
-                node_elem.set("color", data["color"])
-                node_elem.set("type", data["type"])
-                node_elem.set("description", data.get("description", ""))
-                node_elem.set("risk_score", str(data.get("risk_score", 0)))
-                node_elem.set("compliance", data.get("compliance", ""))
-            
-            connections_elem = ET.SubElement(root, "Connections")
-            for source, target in connections:
-                conn = ET.SubElement(connections_elem, "Connection")
-                conn.set("source", source)
-                conn.set("target", target)
-            
-            xml_string = ET.tostring(root, encoding='unicode')
+            # Stream elements out incrementally instead of materializing the
+            # whole document tree plus its serialized string in memory
+            rows = build_export_rows(framework_hash()).to_dict(orient="records")
+            buf = BytesIO()
+            with etree.xmlfile(buf, encoding='utf-8') as xf:
+                xf.write_declaration()
+                with xf.element("SABSAFramework", version="4.0",
+                                generated_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                user=st.session_state.user["username"]):
+                    for section, type_name in (("MainDomains", "Main Domain"),
+                                               ("SecondaryNodes", "Secondary"),
+                                               ("ProcessNodes", "Process")):
+                        with xf.element(section):
+                            for row in rows:
+                                if row["Type"] != type_name:
+                                    continue
+                                attrs = {"name": row["Node"], "x": str(row["X"]),
+                                         "y": str(row["Y"]), "color": row["Color"]}
+                                if type_name == "Secondary":
+                                    attrs["parent"] = row["Parent"]
+                                elif type_name == "Process":
+                                    attrs["type"] = "process"
+                                attrs["description"] = row["Description"]
+                                attrs["risk_score"] = str(row["Risk Score"])
+                                attrs["compliance"] = row["Compliance"]
+                                xf.write(etree.Element("Node", attrs))
+                    with xf.element("Connections"):
+                        for source, target in connections:
+                            xf.write(etree.Element("Connection", source=source, target=target))
+
             st.download_button(
                 label="Download XML",
-                data=xml_string,
+                data=buf.getvalue(),
                 file_name="sabsa_framework.xml",
                 mime="application/xml"
             )
@@ -948,13 +1173,19 @@ def show_detailed_view():
         
         risk_df = pd.DataFrame(risk_data)
         fig_risk = go.Figure()
+        # Bin server-side so the browser receives O(bins) bar heights
+        # instead of every raw risk score
+        edges = np.linspace(0, 1, 21)
+        centers = (edges[:-1] + edges[1:]) / 2
         for node_type in risk_df["Type"].unique():
             type_df = risk_df[risk_df["Type"] == node_type]
-            fig_risk.add_trace(go.Histogram(
-                x=type_df["Risk Score"],
+            counts, _ = np.histogram(type_df["Risk Score"].to_numpy(), bins=edges)
+            fig_risk.add_trace(go.Bar(
+                x=centers,
+                y=counts,
                 name=node_type,
                 opacity=0.6,
-                nbinsx=20
+                width=0.05
             ))
         
         fig_risk.update_layout(
@@ -983,7 +1214,7 @@ def main():
     
     # Simulated authentication (replace with enterprise SSO)
     if st.session_state.user["role"] == "viewer":
-        st.sidebar.markdown('<div class="alert-error">Viewer role: Management features restricted.</div>', unsafe_allow_html=True)
+        st.sidebar.markdown(ALERT_ERROR.format('Viewer role: Management features restricted.'), unsafe_allow_html=True)
     
     view_mode = st.sidebar.radio(
         "Select View",
@@ -1005,8 +1236,8 @@ def main():
                         "Version ID": version["version_id"],
                         "Timestamp": version["timestamp"],
                         "User": version["user"],
-                        "Nodes": len(version["data"]["main_domains"]) + len(version["data"]["secondary_nodes"]) + len(version["data"]["process_nodes"]),
-                        "Connections": len(version["data"]["connections"])
+                        "Nodes": version["nodes"],
+                        "Connections": version["connections"]
                     })
                 
                 version_df = pd.DataFrame(version_data)
@@ -1025,16 +1256,13 @@ def main():
                 selected_version = st.selectbox("Select Version to Restore", 
                                               [v["version_id"] for v in st.session_state.version_history])
                 if st.button("Restore Version"):
-                    for version in st.session_state.version_history:
-                        if version["version_id"] == selected_version:
-                            st.session_state.framework_data = version["data"].copy()
-                            st.markdown(f'<div class="alert-success">Restored version {selected_version}</div>', unsafe_allow_html=True)
-                            log_action("restore_version", f"Restored version {selected_version}")
-                            break
+                    st.session_state.framework_data = _thaw_framework(load_version(selected_version))
+                    st.markdown(ALERT_SUCCESS.format(f'Restored version {selected_version}'), unsafe_allow_html=True)
+                    log_action("restore_version", f"Restored version {selected_version}")
             else:
                 st.markdown("No version history available.")
         else:
-            st.markdown('<div class="alert-error">Access restricted: Version history available to admins and architects only.</div>', unsafe_allow_html=True)
+            st.markdown(ALERT_ERROR.format('Access restricted: Version history available to admins and architects only.'), unsafe_allow_html=True)
     elif view_mode == "About":
         st.header("About SABSA Framework")
         st.markdown("""